@@ -0,0 +1,106 @@
+import numpy as np
+from itertools import combinations
+from collections import defaultdict
+
+def title_signature(keys):
+    sig = 0
+    for key in keys:
+        sig |= 1 << (hash(key) & 63)
+    return sig
+
+def progressive_intersect(sets):
+    sets = sorted(sets, key=len)
+    result = list(sets[0])
+    for s in sets[1:]:
+        result = [item for item in result if item in s]
+        if not result:
+            break
+    return result
+
+def title_owners(norm):
+    owners = defaultdict(list)
+    for i, keys in enumerate(norm.values()):
+        for key in keys:
+            owners[key].append(i)
+    return owners
+
+def index_common_keys(norm):
+    names = list(norm.keys())
+    owners = title_owners(norm)
+    keys = sorted(owners, key=lambda key: norm[names[owners[key][0]]][key])
+
+    membership = np.zeros((len(names), len(keys)), dtype=bool)
+    for t, key in enumerate(keys):
+        membership[owners[key], t] = True
+    bitmaps = np.packbits(membership, axis=1)
+
+    pair_keys = {}
+    for (i, j) in combinations(range(len(names)), 2):
+        both = bitmaps[i] & bitmaps[j]
+        if both.any():
+            pair_keys[(names[i], names[j])] = [keys[t] for t in np.flatnonzero(np.unpackbits(both, count=len(keys)))]
+        else:
+            pair_keys[(names[i], names[j])] = []
+
+    common_all_keys = [key for key in keys if len(owners[key]) == len(names)]
+    return pair_keys, common_all_keys
+
+def intersect_common_keys(norm):
+    signatures = {name: title_signature(keys) for name, keys in norm.items()}
+
+    pair_keys = {}
+    for (file1, file2) in combinations(norm.keys(), 2):
+        if signatures[file1] & signatures[file2]:
+            small, big = sorted((norm[file1], norm[file2]), key=len)
+            pair_keys[(file1, file2)] = [key for key in small if key in big]
+        else:
+            pair_keys[(file1, file2)] = []
+
+    common_all_keys = progressive_intersect([n.keys() for n in norm.values()])
+    return pair_keys, common_all_keys
+
+def compare_researchers(all_sets):
+    comparisons = []
+    norm = {
+        name: {title.replace(" ", ""): title for title in sorted(titles)}
+        for name, titles in all_sets.items()
+    }
+
+    if len(norm) > 3:
+        pair_keys, common_all_keys = index_common_keys(norm)
+    else:
+        pair_keys, common_all_keys = intersect_common_keys(norm)
+
+    for (file1, file2), common_keys in pair_keys.items():
+        comparisons.append({
+            "Files Compared": f"{file1} ↔ {file2}",
+            "Common Publications": len(common_keys),
+            "Titles": "\n".join(f"- {norm[file1][key]}" for key in common_keys) if common_keys else "None"
+        })
+
+    if len(all_sets) > 2:
+        common_all = sorted({n[key] for key in common_all_keys for n in norm.values()})
+
+        comparisons.append({
+            "Files Compared": "All Researchers",
+            "Common Publications": len(common_all),
+            "Titles": "\n".join(f"- {title}" for title in common_all) if common_all else "None"
+        })
+
+    return comparisons
+
+def overlap_regions(all_sets):
+    names = list(all_sets.keys())
+    masks = {}
+    for i, titles in enumerate(all_sets.values()):
+        for key in {title.replace(" ", "") for title in titles}:
+            masks[key] = masks.get(key, 0) | (1 << i)
+
+    region_sizes = {}
+    for mask in masks.values():
+        region_sizes[mask] = region_sizes.get(mask, 0) + 1
+
+    return {
+        " & ".join(name for i, name in enumerate(names) if mask >> i & 1): size
+        for mask, size in sorted(region_sizes.items())
+    }
@@ -0,0 +1,79 @@
+import os
+import fitz
+import re
+import hashlib
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_CID_FOR_UNKNOWN_UNICODE
+HEADER_FRACTION = 0.15
+POOL_MIN_BYTES = 8 * 1024 * 1024
+_YEAR_RE = re.compile(r'(?:20\d{2}|19\d{2})')
+
+def is_blue(color_int):
+    r = (color_int >> 16) & 0xFF
+    g = (color_int >> 8) & 0xFF
+    b = color_int & 0xFF
+    return b > r and b > g
+
+def parse_scholar_pdf(data: bytes) -> tuple[bool, dict]:
+    pdf_document = fitz.open(stream=data, filetype="pdf")
+
+    try:
+        page1 = pdf_document.load_page(0)
+
+        header = fitz.Rect(0, 0, page1.rect.width, page1.rect.height * HEADER_FRACTION)
+        header_blocks = page1.get_text("blocks", clip=header)
+
+        if not any(block[6] == 0 and "Google Scholar" in block[4] for block in header_blocks):
+            return False, {}
+
+        blue_texts = {}
+        title_parts = []
+        current_year = None
+        pending = deque()
+
+        for page in pdf_document:
+            blocks = page.get_text("dict", flags=TEXT_FLAGS)["blocks"]
+
+            spans = (span for block in blocks if "lines" in block for line in block["lines"] for span in line["spans"])
+
+            for span in spans:
+                if is_blue(span['color']):
+                    title_parts.append(span['text'])
+                else:
+                    if title_parts:
+                        title = " ".join(title_parts).strip()
+                        if title:
+                            blue_texts[title] = None 
+                            pending.append(title)
+                        title_parts.clear()
+
+                    year_match = _YEAR_RE.fullmatch(span['text'].strip())
+                    if year_match:
+                        current_year = int(year_match.group(0))
+                        while pending:
+                            blue_texts[pending.popleft()] = current_year
+
+        while pending and current_year:
+            blue_texts[pending.popleft()] = current_year
+
+    finally:
+        pdf_document.close()
+
+    return True, blue_texts
+
+def parse_pdfs(pdf_bytes, cache):
+    digests = [hashlib.blake2b(data, digest_size=16).digest() for data in pdf_bytes]
+    misses = {digest: data for digest, data in zip(digests, pdf_bytes) if digest not in cache}
+
+    workers = min(len(misses), os.cpu_count() or 1)
+    if workers < 2 or sum(map(len, misses.values())) < POOL_MIN_BYTES:
+        results = [parse_scholar_pdf(data) for data in misses.values()]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            results = list(executor.map(parse_scholar_pdf, misses.values()))
+
+    cache.update(zip(misses.keys(), results))
+    return [cache[digest] for digest in digests]
@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import scholar_compare
+
+
+def random_norm(rng):
+    norm = {}
+    for i in range(rng.randint(2, 8)):
+        titles = {f"Title {rng.randint(0, 30)}" for _ in range(rng.randint(0, 15))}
+        norm[f"researcher{i}.pdf"] = {title.replace(" ", ""): title for title in sorted(titles)}
+    return norm
+
+
+def test_bitmap_path_matches_pairwise_intersections():
+    rng = random.Random(0)
+    for _ in range(500):
+        norm = random_norm(rng)
+        assert scholar_compare.index_common_keys(norm) == scholar_compare.intersect_common_keys(norm)
+
+
+def test_many_researchers_match_titles_ignoring_spaces():
+    comparisons = scholar_compare.compare_researchers({
+        "a.pdf": frozenset({"Graph Networks", "Shared Work"}),
+        "b.pdf": frozenset({"GraphNetworks", "Shared Work"}),
+        "c.pdf": frozenset({"Shared Work"}),
+        "d.pdf": frozenset({"Shared  Work", "Other"}),
+    })
+    rows = {row["Files Compared"]: row for row in comparisons}
+
+    assert rows["a.pdf ↔ b.pdf"]["Common Publications"] == 2
+    assert rows["a.pdf ↔ b.pdf"]["Titles"] == "- Graph Networks\n- Shared Work"
+    assert rows["c.pdf ↔ d.pdf"]["Common Publications"] == 1
+    assert rows["All Researchers"]["Titles"] == "- Shared  Work\n- Shared Work"
+
+
+def test_overlap_regions_group_titles_ignoring_spaces():
+    regions = scholar_compare.overlap_regions({
+        "a.pdf": {"Graph Networks", "Only A"},
+        "b.pdf": {"GraphNetworks"},
+    })
+
+    assert regions == {"a.pdf": 1, "a.pdf & b.pdf": 1}
+
+
+@pytest.mark.parametrize("count", [2, 4])
+def test_common_titles_are_listed_in_display_order(count):
+    titles = frozenset({"AB Test", "A Study"})
+    comparisons = scholar_compare.compare_researchers({f"{i}.pdf": titles for i in range(count)})
+
+    assert {row["Titles"] for row in comparisons} == {"- A Study\n- AB Test"}
@@ -0,0 +1,137 @@
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+import scholar_pdf
+
+BLUE = 0x1A0DAB
+GREY = 0x777777
+
+
+class StubPage:
+    rect = fitz.Rect(0, 0, 600, 800)
+
+    def __init__(self, spans):
+        self.spans = spans
+
+    def get_text(self, option, **kwargs):
+        if option == "blocks":
+            return [(0, 0, 600, 40, "Google Scholar", 0, 0)]
+        spans = [{"text": text, "color": color} for text, color in self.spans]
+        return {"blocks": [{"lines": [{"spans": spans}]}]}
+
+
+class StubDocument:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def load_page(self, number):
+        return self.pages[number]
+
+    def __iter__(self):
+        return iter(self.pages)
+
+    def close(self):
+        pass
+
+
+def parse(monkeypatch, *pages):
+    document = StubDocument([StubPage(spans) for spans in pages])
+    monkeypatch.setattr(scholar_pdf.fitz, "open", lambda **kwargs: document)
+    return scholar_pdf.parse_scholar_pdf(b"%PDF")
+
+
+def test_year_comes_from_year_column_not_venue(monkeypatch):
+    is_scholar, titles = parse(monkeypatch, [
+        ("Deep Learning for Graphs", BLUE),
+        ("A Author, B Author", GREY),
+        ("arXiv preprint arXiv:2010.12345", GREY),
+        ("2021", GREY),
+        ("Signal Processing Survey", BLUE),
+        ("C Author", GREY),
+        ("Proc. IEEE 1998-2004", GREY),
+        (" 2019 ", GREY),
+    ])
+
+    assert is_scholar
+    assert titles == {"Deep Learning for Graphs": 2021, "Signal Processing Survey": 2019}
+
+
+def test_year_column_of_a_real_pdf():
+    document = fitz.open()
+    page = document.new_page()
+    page.insert_text((50, 40), "Google Scholar", fontsize=16)
+    rows = [
+        ("Deep Learning for Graphs", "arXiv preprint arXiv:2010.12345", "2021"),
+        ("Signal Processing Survey", "Proc. IEEE 1998-2004", "2019"),
+    ]
+    for row, (title, venue, year) in enumerate(rows):
+        y = 150 + row * 60
+        page.insert_text((50, y), title, color=(0.1, 0.05, 0.67))
+        page.insert_text((50, y + 14), "A Author, B Author", color=(0.47, 0.47, 0.47))
+        page.insert_text((50, y + 28), venue, color=(0.47, 0.47, 0.47))
+        page.insert_text((500, y), year, color=(0.47, 0.47, 0.47))
+
+    is_scholar, titles = scholar_pdf.parse_scholar_pdf(document.tobytes())
+
+    assert is_scholar
+    assert titles == {"Deep Learning for Graphs": 2021, "Signal Processing Survey": 2019}
+
+
+def test_pending_titles_take_next_year_across_pages(monkeypatch):
+    _, titles = parse(
+        monkeypatch,
+        [("First Title", BLUE), ("2020", GREY), ("Second Title", BLUE), ("D Author", GREY)],
+        [("2018", GREY)],
+    )
+
+    assert titles == {"First Title": 2020, "Second Title": 2018}
+
+
+def test_titles_without_a_following_year_use_last_year_seen(monkeypatch):
+    _, titles = parse(monkeypatch, [("Old Title", BLUE), ("2017", GREY), ("Last Title", BLUE), ("E Author", GREY)])
+
+    assert titles == {"Old Title": 2017, "Last Title": 2017}
+
+
+def scholar_pdf_bytes(title):
+    document = fitz.open()
+    page = document.new_page()
+    page.insert_text((50, 40), "Google Scholar", fontsize=16)
+    page.insert_text((50, 150), title, color=(0.1, 0.05, 0.67))
+    page.insert_text((500, 150), "2024", color=(0.47, 0.47, 0.47))
+    return document.tobytes()
+
+
+def test_parse_pdfs_only_parses_cache_misses(monkeypatch):
+    parsed = []
+    parse = scholar_pdf.parse_scholar_pdf
+    monkeypatch.setattr(scholar_pdf, "parse_scholar_pdf", lambda data: parsed.append(data) or parse(data))
+    first, second = scholar_pdf_bytes("First Title"), scholar_pdf_bytes("Second Title")
+    cache = {}
+
+    assert scholar_pdf.parse_pdfs([first], cache) == [(True, {"First Title": 2024})]
+    assert scholar_pdf.parse_pdfs([first, second], cache) == [
+        (True, {"First Title": 2024}),
+        (True, {"Second Title": 2024}),
+    ]
+    assert parsed == [first, second]
+
+
+@pytest.mark.parametrize("cpu_count, min_bytes", [(1, 0), (4, 8 * 1024 * 1024)])
+def test_parse_pdfs_parses_serially_without_spare_cores_or_enough_work(monkeypatch, cpu_count, min_bytes):
+    monkeypatch.setattr(scholar_pdf.os, "cpu_count", lambda: cpu_count)
+    monkeypatch.setattr(scholar_pdf, "POOL_MIN_BYTES", min_bytes)
+    monkeypatch.setattr(scholar_pdf, "ProcessPoolExecutor", None)
+
+    results = scholar_pdf.parse_pdfs([scholar_pdf_bytes("One"), scholar_pdf_bytes("Two")], {})
+
+    assert results == [(True, {"One": 2024}), (True, {"Two": 2024})]
+
+
+def test_parse_pdfs_pool_matches_serial_parse(monkeypatch):
+    monkeypatch.setattr(scholar_pdf.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(scholar_pdf, "POOL_MIN_BYTES", 0)
+    pdfs = [scholar_pdf_bytes("One"), scholar_pdf_bytes("Two")]
+
+    assert scholar_pdf.parse_pdfs(pdfs, {}) == [scholar_pdf.parse_scholar_pdf(data) for data in pdfs]